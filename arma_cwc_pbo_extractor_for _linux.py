@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
-import os, struct, threading, queue, shutil, subprocess, stat, glob
+import os, re, signal, struct, threading, queue, shutil, subprocess, stat, time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+# urllib (pulls in ssl/http.client) and glob are imported where they are used,
+# so they don't cost anything at start-up.
 
 # ============================ Config ============================
 HOME = os.path.expanduser("~")
@@ -32,6 +32,12 @@ DEOGG_LOCAL      = os.path.join(TOOLS_DIR, "DeOgg_Installer.exe")
 
 APT_PKGS = ["wine-stable", "winbind", "cabextract", "p7zip-full"]
 
+# Tool processes (cpbo / unrap under Wine)
+TOOL_TIMEOUT      = 15 * 60      # seconds before a stuck tool is killed
+TOOL_PARALLEL     = 4            # max tool processes running at once in batch jobs
+STREAM_LINE_LIMIT = 1024 * 1024  # longer output lines are logged in chunks of this size
+STREAM_CHUNK      = 64 * 1024    # bytes read from a tool's stdout at a time
+
 MPMISSIONS_CANDIDATES = [
     "~/.local/share/Steam/steamapps/common/ARMA Cold War Assault/MPMissions",
     "~/.local/share/Steam/steamapps/common/Arma Cold War Assault/MPMissions",
@@ -70,12 +76,79 @@ def get_selected_prefix():
 def set_selected_prefix(prefix_dir):
     write_text(PREFIX_PATH_FILE, prefix_dir)
 
-def run_cmd(cmd, log, check=False, env=None):
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
-    if p.stdout: log(p.stdout.rstrip())
-    if check and p.returncode != 0:
-        raise RuntimeError(f"Command failed: {' '.join(cmd)} (exit {p.returncode})")
-    return p
+def kill_process_group(p):
+    """SIGKILLs p and everything it started (p runs in its own session)."""
+    try:
+        os.killpg(p.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+async def stream_cmd(cmd, log, env=None, timeout=None, on_line=None):
+    """
+    Runs cmd and hands each stdout/stderr line to log (and on_line) as it arrives.
+    Lines are split on \\n and \\r; a line longer than STREAM_LINE_LIMIT is handed on in chunks.
+    If it runs longer than timeout seconds, or anything here raises, the whole process
+    group is killed. Returns the exit code.
+    """
+    import asyncio
+    # own session: Wine starts helpers that inherit our pipe, and they must die with the tool
+    p = await asyncio.create_subprocess_exec(*cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                             env=env, start_new_session=True)
+    def emit(raw):
+        line = raw.decode("utf-8", errors="replace").rstrip()
+        if not line: return
+        log(line)
+        if on_line: on_line(line)
+    async def pump():
+        buf = b""
+        while True:
+            chunk = await p.stdout.read(STREAM_CHUNK)
+            if not chunk: break
+            parts = re.split(rb"[\r\n]", buf + chunk)
+            buf = parts.pop()
+            for raw in parts: emit(raw)
+            while len(buf) > STREAM_LINE_LIMIT:
+                emit(buf[:STREAM_LINE_LIMIT]); buf = buf[STREAM_LINE_LIMIT:]
+        emit(buf)
+        return await p.wait()
+    try:
+        return await asyncio.wait_for(pump(), timeout)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"Command timed out after {timeout}s: {' '.join(cmd)}")
+    finally:
+        if p.returncode is None:
+            kill_process_group(p)
+            # Close our end of the pipe instead of waiting for EOF: anything that escaped the
+            # group (e.g. a daemonized wineserver) may hold it open. Process has no public close().
+            transport = getattr(p, "_transport", None)
+            if transport: transport.close()
+            await p.wait()
+
+def run_cmd(cmd, log, check=False, env=None, timeout=None, on_line=None):
+    import asyncio
+    rc = asyncio.run(stream_cmd(cmd, log, env=env, timeout=timeout, on_line=on_line))
+    if check and rc != 0:
+        raise RuntimeError(f"Command failed: {' '.join(cmd)} (exit {rc})")
+    return subprocess.CompletedProcess(cmd, rc)
+
+def run_cmds(cmds, log, check=False, env=None, timeout=None, max_parallel=TOOL_PARALLEL):
+    """
+    Runs several commands concurrently on one event loop (at most max_parallel at a time).
+    Returns one exit code per command, or raises if check is set and any command failed.
+    """
+    import asyncio
+    async def run_all():
+        sem = asyncio.Semaphore(max_parallel)
+        async def one(cmd):
+            async with sem:
+                return await stream_cmd(cmd, log, env=env, timeout=timeout)
+        return await asyncio.gather(*(one(c) for c in cmds), return_exceptions=True)
+    results = asyncio.run(run_all())
+    if check:
+        for cmd, rc in zip(cmds, results):
+            if isinstance(rc, Exception): raise rc
+            if rc != 0: raise RuntimeError(f"Command failed: {' '.join(cmd)} (exit {rc})")
+    return results
 
 def write_executable(path, content):
     with open(path, "w") as f: f.write(content)
@@ -89,6 +162,8 @@ def path_contains_local_bin():
     return False
 
 def http_download(url, dest_path, log, timeout=60):
+    from urllib.request import urlopen, Request
+    from urllib.error import URLError, HTTPError
     try:
         req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
         with urlopen(req, timeout=timeout) as r, open(dest_path, "wb") as w:
@@ -160,13 +235,97 @@ def extract_uncompressed(pbo_path, outdir, log_fn, progress_fn):
             progress_fn((frac_files + frac_bytes)/2.0)
     log_fn(f"✅ Extracted to: {outdir}")
 
+def read_pbo_index(f):
+    """
+    Reads a PBO header from an open file. Handles the optional 'Vers' header entry.
+    Returns ([(name, packing, orig_sz, data_sz, offset)], ...) with absolute data offsets.
+    """
+    entries = []
+    while True:
+        name = read_cstr(f)
+        fields = f.read(20)
+        if len(fields) != 20: raise EOFError("Truncated header")
+        packing, orig_sz, _res, _ts, data_sz = struct.unpack("<IIIII", fields)
+        if name == "":
+            if packing != 0x56657273: break    # terminator entry
+            while read_cstr(f) != "": pass     # 'Vers' properties: key/value pairs
+            continue
+        entries.append([name, packing, orig_sz, data_sz, 0])
+    offset = f.tell()
+    for e in entries:
+        e[4] = offset
+        offset += e[3]
+    return [tuple(e) for e in entries]
+
+def pbo_entry_names(pbo_path):
+    """Lists file names from a PBO header (compressed or not). Returns [] if the header can't be read."""
+    try:
+        with open(pbo_path, "rb") as f:
+            return [e[0] for e in read_pbo_index(f)]
+    except (OSError, EOFError):
+        return []
+
+def read_pbo_member(pbo_path, member):
+    """
+    Returns the bytes of one file inside a PBO without extracting the rest (case-insensitive
+    name), or None if it isn't there. Raises RuntimeError for compressed entries.
+    """
+    want = member.replace("/", "\\").lower()
+    with open(pbo_path, "rb") as f:
+        for name, packing, orig_sz, data_sz, offset in read_pbo_index(f):
+            if name.replace("/", "\\").lower() != want: continue
+            if packing != 0 or (orig_sz and orig_sz != data_sz):
+                raise RuntimeError(f"'{name}' is compressed (packing={packing}). Use cpbo.")
+            f.seek(offset)
+            data = f.read(data_sz)
+            if len(data) != data_sz: raise EOFError(f"Truncated data for {name}")
+            return data
+    return None
+
+def line_path_candidates(line, max_words=8):
+    """
+    Yields the file paths a tool output line could be naming, longest first: every run of
+    up to max_words words, plus each of its sub-paths after a '/' (so 'C:/out/a.sqm' → 'a.sqm').
+    """
+    words = line.replace("\\", "/").lower().split()
+    spans = []
+    for i in range(len(words)):
+        for j in range(i + 1, min(len(words), i + max_words) + 1):
+            cand = " ".join(words[i:j]).strip("'\"`:,;()[]<>")
+            while cand:
+                spans.append(cand)
+                cut = cand.find("/")
+                if cut < 0: break
+                cand = cand[cut + 1:]
+    return sorted(set(spans), key=len, reverse=True)
+
+def extract_progress_parser(pbo_path, progress_fn):
+    """
+    Returns an on_line callback for cpbo/ExtractPbo output. Each line that names a
+    file from the PBO header counts as one file done; progress_fn gets the fraction.
+    The longest header name found in the line wins, so 'mission.sqm.bak' never
+    uses up 'mission.sqm'.
+    """
+    pending = {n.replace("\\", "/").lower() for n in pbo_entry_names(pbo_path)}
+    total = len(pending)
+    def on_line(line):
+        if not pending: return
+        hit = next((c for c in line_path_candidates(line) if c in pending), None)
+        if hit is None: return
+        pending.discard(hit)
+        progress_fn((total - len(pending)) / total)
+    return on_line
+
 # =================== cpbo / unRap helpers ======================
-def cpbo_extract(pbo_path, outdir, log):
-    return run_cmd(["cpbo", "-e", pbo_path, outdir], log, check=True)
+def cpbo_extract(pbo_path, outdir, log, progress_fn=None):
+    on_line = extract_progress_parser(pbo_path, progress_fn) if progress_fn else None
+    return run_cmd(["cpbo", "-e", pbo_path, outdir], log, check=True, timeout=TOOL_TIMEOUT, on_line=on_line)
 def cpbo_pack(folder, out_pbo, log):
-    return run_cmd(["cpbo", "-p", folder, out_pbo], log, check=True)
+    return run_cmd(["cpbo", "-p", folder, out_pbo], log, check=True, timeout=TOOL_TIMEOUT)
 def unrap_file(path, log):
-    return run_cmd(["unrap", path], log, check=True)
+    return run_cmd(["unrap", path], log, check=True, timeout=TOOL_TIMEOUT)
+def unrap_files(paths, log):
+    return run_cmds([["unrap", p] for p in paths], log, check=True, timeout=TOOL_TIMEOUT)
 
 def inject_respawn_stub(folder, delay=5):
     path = os.path.join(folder, "description.ext")
@@ -188,6 +347,567 @@ def inject_respawn_stub(folder, delay=5):
     with open(path, "w", encoding="utf-8") as f:
         f.write("\n".join(new_lines) + "\n")
 
+# ============== Asset analysis & slim PBO ========================
+# Files the engine loads by name without any script referring to them
+MISSION_ROOT_FILES = {
+    "mission.sqm", "description.ext", "stringtable.csv", "init.sqs", "init.sqf", "exit.sqs",
+    "onflare.sqs", "onplayerkilled.sqs", "onplayerresurrect.sqs",
+    "onplayerrespawnasseagull.sqs", "onplayerrespawnotherunit.sqs",
+}
+MISSION_ROOT_PREFIXES = ("briefing.", "overview.")   # briefing*.html / overview*.html
+# Folders the engine searches when a script names a bare sound/music file
+SOUND_DIRS = ("sound", "music")
+SCANNED_EXTS = (".sqm", ".ext", ".sqs", ".sqf", ".csv", ".html", ".hpp", ".h", ".inc")
+ASSET_EXTS = "sqs|sqf|sqm|ogg|wss|wav|lip|paa|pac|jpg|jpeg|html|hpp|h|csv|p3d|rtm"
+# A whole string literal naming a file; spaces are allowed, code punctuation and commas are not.
+# '%' stays in so format ["voice%1.ogg", n] patterns can be matched as wildcards.
+ASSET_NAME_RE = re.compile(rf"[^\"'\n,;{{}}\[\]=<>|*?]+\.(?:{ASSET_EXTS})", re.IGNORECASE)
+# "..." with "" escapes, {...} (OFP code strings), and '...' (sqf only)
+DQ_STRING_RE = re.compile(r'"((?:[^"]|"")*)"')
+BRACE_STRING_RE = re.compile(r"\{([^{}\"]*)\}")
+SQ_STRING_RE = re.compile(r"'((?:[^']|'')*)'")
+FORMAT_ARG_RE = re.compile(r"(%\d+)")
+# Commands whose string argument is always a file, whatever its extension
+FILE_CALL_RE = re.compile(
+    r'(?:#include|\b(?:loadFile|preprocessFile|preprocessFileLineNumbers|execVM|exec))\s*[<"{]([^">}\n]+)[">}]',
+    re.IGNORECASE)
+CONFIG_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)   # DeRap headers etc.
+
+def list_mission_files(folder):
+    """Returns {lowercase relpath with '/': real relpath} for every file in a mission folder."""
+    files = {}
+    for dirpath, _dirs, names in os.walk(folder):
+        for n in names:
+            rel = os.path.relpath(os.path.join(dirpath, n), folder).replace(os.sep, "/")
+            files[rel.lower()] = rel
+    return files
+
+def is_mission_root(rel):
+    low = rel.lower()
+    return low in MISSION_ROOT_FILES or (low.startswith(MISSION_ROOT_PREFIXES) and low.endswith(".html"))
+
+def string_literals(text, single_quotes=False):
+    """Yields every string literal in text, including strings nested inside strings."""
+    found = [m.group(1).replace('""', '"') for m in DQ_STRING_RE.finditer(text)]
+    found += [m.group(1) for m in BRACE_STRING_RE.finditer(text)]
+    if single_quotes:
+        found += [m.group(1).replace("''", "'") for m in SQ_STRING_RE.finditer(text)]
+    for lit in found:
+        yield lit
+        if '"' in lit or "{" in lit or (single_quotes and "'" in lit):
+            yield from string_literals(lit, single_quotes)
+
+def asset_refs(text, key, files):
+    """
+    File names a scanned mission file refers to: string literals that name a file in the
+    mission (any extension) or look like an asset name, plus the targets of #include,
+    loadFile, exec and friends (those count even when the file is missing).
+    """
+    if key.endswith((".sqm", ".ext", ".hpp", ".h", ".inc")):
+        text = CONFIG_COMMENT_RE.sub("", text)
+    refs = set()
+    lits = [lit.strip() for lit in string_literals(text, single_quotes=key.endswith(".sqf"))]
+    for lit in lits:
+        if ASSET_NAME_RE.fullmatch(lit):
+            refs.add(lit)
+        elif lit and "\n" not in lit and "%" not in lit and len(lit) < 260 \
+                and resolve_asset_ref(lit, key, files):
+            refs.add(lit)
+    for t in [text] + lits:
+        refs.update(m.group(1).strip() for m in FILE_CALL_RE.finditer(t))
+    return refs
+
+def resolve_asset_ref(ref, src, files):
+    """
+    Maps a reference found in src to the set of keys of files it can mean (empty if none).
+    A format pattern ('voice%1.ogg') keeps every file it could expand to.
+    """
+    ref = ref.replace("\\", "/").lstrip("/").lower()
+    base = os.path.dirname(src.lower())
+    cands = [ref, f"{base}/{ref}" if base else ref]
+    cands += [f"{d}/{ref}" for d in SOUND_DIRS]
+    if "%" not in ref:
+        return next(({c} for c in cands if c in files), set())
+    pats = [re.compile("".join(".+" if FORMAT_ARG_RE.fullmatch(part) else re.escape(part)
+                               for part in FORMAT_ARG_RE.split(c))) for c in cands]
+    return {k for k in files if any(p.fullmatch(k) for p in pats)}
+
+def analyze_mission_assets(folder):
+    """
+    Builds a reference graph for a mission folder and works out which files are used.
+    Roots are the files the engine loads by itself (mission.sqm, description.ext, init.sqs,
+    briefing/overview pages, ...); every file reachable from them is kept.
+    References are the string literals that name a file; format patterns such as
+    "voice%1.ogg" keep every file they could match.
+    Returns a dict with 'graph', 'used', 'unused', 'missing' and 'unused_bytes'.
+    """
+    files = list_mission_files(folder)
+    sqm = os.path.join(folder, files.get("mission.sqm", "mission.sqm"))
+    if os.path.isfile(sqm):
+        with open(sqm, "rb") as f:
+            if f.read(4) == b"\0raP":
+                raise RuntimeError("mission.sqm is binarized; DeRap it before analyzing assets.")
+
+    graph, missing = {}, {}
+    for key, rel in files.items():
+        refs = set()
+        if key.endswith(SCANNED_EXTS):
+            with open(os.path.join(folder, rel), "r", encoding="latin-1") as f:
+                text = f.read()
+            for ref in asset_refs(text, key, files):
+                hits = resolve_asset_ref(ref, key, files)
+                if not hits: missing.setdefault(ref, set()).add(rel)
+                refs |= hits - {key}
+        graph[key] = refs
+
+    used = set()
+    todo = [k for k in files if is_mission_root(k)]
+    while todo:
+        k = todo.pop()
+        if k in used: continue
+        used.add(k)
+        todo.extend(graph[k] - used)
+        # lip-sync data rides along with its sound
+        if k.endswith((".ogg", ".wss", ".wav")):
+            lip = os.path.splitext(k)[0] + ".lip"
+            if lip in files: todo.append(lip)
+
+    unused = sorted(files[k] for k in files if k not in used)
+    return {
+        "graph": {files[k]: sorted(files[r] for r in v) for k, v in graph.items()},
+        "used": sorted(files[k] for k in used),
+        "unused": unused,
+        "missing": {ref: sorted(srcs) for ref, srcs in sorted(missing.items())},
+        "unused_bytes": sum(os.path.getsize(os.path.join(folder, r)) for r in unused),
+    }
+
+def log_asset_report(report, log):
+    log(f"Assets: {len(report['used'])} used, {len(report['unused'])} unused "
+        f"({report['unused_bytes']} bytes could be dropped).")
+    for rel in report["unused"]:
+        log(f"  unused: {rel}")
+    for ref, srcs in report["missing"].items():
+        log(f"  not in mission (addon/game data?): {ref}  ← {', '.join(srcs)}")
+
+def build_slim_pbo(folder, out_pbo, log, allow_unresolved=False, report=None):
+    """
+    Packs only the files analyze_mission_assets marks as used (via cpbo -p).
+    Pass report to reuse an analysis the caller already ran.
+    Refuses if some references could not be resolved, unless allow_unresolved is set:
+    an unresolved name may be a file the analysis failed to connect.
+    """
+    import tempfile
+    if report is None:
+        report = analyze_mission_assets(folder)
+        log_asset_report(report, log)
+    if report["missing"] and not allow_unresolved:
+        raise RuntimeError(f"{len(report['missing'])} reference(s) could not be resolved; "
+                           "not pruning without confirmation.")
+    with tempfile.TemporaryDirectory(prefix="slim_pbo_") as tmp:
+        # keep the mission folder name; MakePbo derives the PBO prefix from it
+        stage = os.path.join(tmp, os.path.basename(os.path.normpath(folder)))
+        for rel in report["used"]:
+            dst = os.path.join(stage, rel)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copy2(os.path.join(folder, rel), dst)
+        cpbo_pack(stage, out_pbo, log)
+    return report
+
+# ===================== mission.sqm parsing ======================
+CONFIG_TOKEN_RE = re.compile(r'''
+    "(?P<str>(?:[^"]|"")*)"
+  | (?P<num>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w$@])
+  | (?P<word>[A-Za-z_$@][\w$@.\-]*)(?P<arr>\[\])?
+  | (?P<sym>[{}=;,:])
+''', re.VERBOSE)
+
+def parse_config(text):
+    """
+    Parses a text (DeRapped) config such as mission.sqm into nested dicts.
+    Class and property names are lower-cased; arrays become lists.
+    """
+    text = CONFIG_COMMENT_RE.sub("", text)
+    text = re.sub(r"(?m)^\s*#.*$", "", text)
+    toks = []
+    for m in CONFIG_TOKEN_RE.finditer(text):
+        if m.group("str") is not None: toks.append(("val", m.group("str").replace('""', '"')))
+        elif m.group("num") is not None: toks.append(("val", float(m.group("num"))))
+        elif m.group("word") is not None: toks.append(("word", m.group("word")))
+        else: toks.append(("sym", m.group("sym")))
+    pos = 0
+
+    def array():
+        nonlocal pos
+        out = []
+        while pos < len(toks):
+            kind, v = toks[pos]; pos += 1
+            if kind == "sym" and v == "}": return out
+            if kind == "sym" and v == ",": continue
+            if kind == "sym" and v == "{": out.append(array())
+            else: out.append(v)
+        return out
+
+    def body():
+        nonlocal pos
+        node = {}
+        while pos < len(toks):
+            kind, v = toks[pos]; pos += 1
+            if kind == "sym":
+                if v == "}": return node
+                continue
+            if v == "class":
+                name = toks[pos][1].lower(); pos += 1
+                if pos < len(toks) and toks[pos] == ("sym", ":"): pos += 2   # skip base class
+                if pos < len(toks) and toks[pos] == ("sym", "{"):
+                    pos += 1
+                    node[name] = body()
+                else:
+                    node[name] = {}
+                continue
+            key = v.lower()
+            if pos < len(toks) and toks[pos] == ("sym", "="):
+                pos += 1
+                if pos < len(toks) and toks[pos] == ("sym", "{"):
+                    pos += 1
+                    node[key] = array()
+                else:
+                    vals = []
+                    while pos < len(toks) and toks[pos] != ("sym", ";"):
+                        vals.append(toks[pos][1]); pos += 1
+                    node[key] = vals[0] if len(vals) == 1 else " ".join(str(x) for x in vals)
+        return node
+
+    return body()
+
+def config_items(node):
+    """Yields the ItemN sub-classes of a class in index order."""
+    items = [(int(k[4:]), v) for k, v in node.items() if k.startswith("item") and k[4:].isdigit()]
+    for _i, v in sorted(items, key=lambda t: t[0]):
+        yield v
+
+def read_mission_sqm(folder):
+    path = os.path.join(folder, "mission.sqm")
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:4] == b"\0raP":
+        raise RuntimeError(f"{path} is binarized; DeRap it first.")
+    return parse_config(raw.decode("latin-1"))
+
+# =================== Columnar mission analytics =================
+# Rows are units, empty vehicles, markers and waypoints; one NumPy array per column.
+# position[] in mission.sqm is {x, altitude, y}; we store map x/y plus z = altitude.
+MISSION_COLUMNS = ("kind", "side", "cls", "name", "x", "y", "z", "azimut", "group")
+MISSION_CACHE_DIR = os.path.join(TOOLS_DIR, "mission_cache")
+MISSION_CACHE_VERSION = 1
+
+def import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("Mission analytics need NumPy: python3 -m pip install --user numpy")
+    return np
+
+def mission_rows(sqm):
+    """Flattens a parsed mission.sqm into row tuples matching MISSION_COLUMNS."""
+    mission = sqm.get("mission", {})
+    rows = []
+    def pos3(item):
+        p = list(item.get("position", [])) + [0.0, 0.0, 0.0]
+        return float(p[0]), float(p[2]), float(p[1])
+    for gi, grp in enumerate(config_items(mission.get("groups", {}))):
+        side = str(grp.get("side", ""))
+        for u in config_items(grp.get("vehicles", {})):
+            rows.append(("unit", str(u.get("side", side)), str(u.get("vehicle", "")), str(u.get("text", "")),
+                         *pos3(u), float(u.get("azimut", 0.0)), gi))
+        for w in config_items(grp.get("waypoints", {})):
+            rows.append(("waypoint", side, str(w.get("type", "MOVE")), "",
+                         *pos3(w), float("nan"), gi))
+    for v in config_items(mission.get("vehicles", {})):
+        rows.append(("vehicle", str(v.get("side", "EMPTY")), str(v.get("vehicle", "")), str(v.get("text", "")),
+                     *pos3(v), float(v.get("azimut", 0.0)), -1))
+    for mk in config_items(mission.get("markers", {})):
+        rows.append(("marker", "", str(mk.get("type", "")), str(mk.get("name", "")),
+                     *pos3(mk), float(mk.get("angle", 0.0)), -1))
+    return rows
+
+def rows_to_columns(rows):
+    np = import_numpy()
+    cols = list(zip(*rows)) if rows else [()] * len(MISSION_COLUMNS)
+    out = {}
+    for name, vals in zip(MISSION_COLUMNS, cols):
+        if name in ("x", "y", "z", "azimut"): out[name] = np.array(vals, dtype=np.float64)
+        elif name == "group": out[name] = np.array(vals, dtype=np.int32)
+        else: out[name] = np.array(vals, dtype=str)
+    return out
+
+def mission_cache_path(folder):
+    import hashlib
+    key = hashlib.sha1(os.path.abspath(folder).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(MISSION_CACHE_DIR, f"{key}.npz")
+
+def mission_columns(folder):
+    """
+    Returns the columns (dict of NumPy arrays) for one mission folder. Results are cached
+    as .npz under MISSION_CACHE_DIR and reused until mission.sqm changes.
+    """
+    import tempfile
+    np = import_numpy()
+    st = os.stat(os.path.join(folder, "mission.sqm"))
+    stamp = np.array([MISSION_CACHE_VERSION, st.st_mtime_ns, st.st_size], dtype=np.int64)
+    cache = mission_cache_path(folder)
+    try:
+        with np.load(cache, allow_pickle=False) as z:
+            if np.array_equal(z["_stamp"], stamp):
+                return {c: z[c] for c in MISSION_COLUMNS}
+    except (OSError, KeyError, ValueError):
+        pass
+    cols = rows_to_columns(mission_rows(read_mission_sqm(folder)))
+    os.makedirs(MISSION_CACHE_DIR, exist_ok=True)
+    # unique temp name: two workers may cache the same mission at once
+    with tempfile.NamedTemporaryFile(dir=MISSION_CACHE_DIR, suffix=".tmp", delete=False) as f:
+        np.savez(f, _stamp=stamp, **cols)
+    os.replace(f.name, cache)
+    return cols
+
+def find_mission_folders(root):
+    """Mission folders directly under root (or root itself) that contain a mission.sqm."""
+    found = [root] if os.path.isfile(os.path.join(root, "mission.sqm")) else []
+    try:
+        subs = sorted(os.scandir(root), key=lambda e: e.name.lower())
+    except OSError:
+        return found
+    found += [e.path for e in subs if e.is_dir() and os.path.isfile(os.path.join(e.path, "mission.sqm"))]
+    return found
+
+def load_mission_library(root, log=None):
+    """
+    Concatenates the columns of every mission under root and adds a 'mission' column
+    (folder name). Missions that can't be read are skipped and logged.
+    """
+    np = import_numpy()
+    parts, names = [], []
+    for folder in find_mission_folders(root):
+        try:
+            cols = mission_columns(folder)
+        except Exception as e:
+            if log: log(f"Skipping {folder}: {e}")
+            continue
+        parts.append(cols)
+        names.append(np.full(len(cols["kind"]), os.path.basename(os.path.normpath(folder))))
+    if not parts:
+        lib = rows_to_columns([])
+        lib["mission"] = np.array([], dtype=str)
+        return lib
+    lib = {c: np.concatenate([p[c] for p in parts]) for c in MISSION_COLUMNS}
+    lib["mission"] = np.concatenate(names)
+    return lib
+
+def select_rows(cols, **match):
+    """Filters every column by equality, e.g. select_rows(lib, kind="unit", mission="1-16_Cooperative.Noe")."""
+    mask = None
+    for k, v in match.items():
+        m = cols[k] == v
+        mask = m if mask is None else mask & m
+    if mask is None: return cols
+    return {k: a[mask] for k, a in cols.items()}
+
+def side_counts(cols):
+    np = import_numpy()
+    sides, counts = np.unique(cols["side"], return_counts=True)
+    return dict(zip(sides.tolist(), counts.tolist()))
+
+def side_spread(cols):
+    """Per side: (centroid x, centroid y, RMS distance from the centroid)."""
+    np = import_numpy()
+    out = {}
+    for side in np.unique(cols["side"]).tolist():
+        m = cols["side"] == side
+        xy = np.column_stack((cols["x"][m], cols["y"][m]))
+        c = xy.mean(axis=0)
+        out[side] = (float(c[0]), float(c[1]), float(np.sqrt(((xy - c) ** 2).sum(axis=1).mean())))
+    return out
+
+def side_distance_matrix(cols, side_a, side_b):
+    """2-D map distances between every row of side_a (rows) and side_b (columns)."""
+    np = import_numpy()
+    a, b = cols["side"] == side_a, cols["side"] == side_b
+    dx = cols["x"][a][:, None] - cols["x"][b][None, :]
+    dy = cols["y"][a][:, None] - cols["y"][b][None, :]
+    return np.hypot(dx, dy)
+
+def nearest_distance(cols, targets):
+    """Distance from every row of cols to the closest row of targets (e.g. objective markers)."""
+    np = import_numpy()
+    if len(targets["x"]) == 0: return np.full(len(cols["x"]), np.inf)
+    dx = cols["x"][:, None] - targets["x"][None, :]
+    dy = cols["y"][:, None] - targets["y"][None, :]
+    return np.hypot(dx, dy).min(axis=1)
+
+# ===================== stringtable.csv ==========================
+# A parsed table is {"languages": [...], "keys": {KEY_UPPER: [value per language]}}.
+# Tables are cached by the SHA-1 of the CSV bytes, in memory and as JSON on disk.
+STRINGTABLE_CACHE_DIR = os.path.join(TOOLS_DIR, "stringtable_cache")
+STRINGTABLE_CACHE_VERSION = 2
+# Columns not listed here are Western European (cp1252)
+STRINGTABLE_CODEPAGES = {"czech": "cp1250", "polish": "cp1250", "hungarian": "cp1250",
+                         "slovak": "cp1250", "russian": "cp1251"}
+STRING_REF_RE = re.compile(r"[@$](STR[A-Za-z0-9_]*)")
+LOCALIZE_RE = re.compile(r'localize\s+"(STR\w*)"', re.IGNORECASE)   # scripts: localize "STR_x"
+BRIEFING_NAME_RE = re.compile(r'briefingName\s*=\s*"((?:[^"]|"")*)"')
+_stringtables = {}
+
+def parse_stringtable(raw):
+    """
+    Parses stringtable.csv bytes. The 'Comment' column and blank/separator rows are dropped.
+    Each language column is decoded with its own Windows codepage (STRINGTABLE_CODEPAGES).
+    """
+    import csv, io
+    # latin-1 maps bytes 1:1, so the CSV structure survives and each cell can be re-decoded
+    rows = csv.reader(io.StringIO(raw.decode("latin-1")), skipinitialspace=True)
+    languages, codepages, keys = [], [], {}
+    for row in rows:
+        if not row or not row[0].strip(): continue
+        cells = [c.strip() for c in row]
+        if cells[0].upper() == "LANGUAGE":
+            languages = [c for c in cells[1:] if c and c.lower() != "comment"]
+            codepages = [STRINGTABLE_CODEPAGES.get(l.lower(), "cp1252") for l in languages]
+            continue
+        if not re.fullmatch(r"\w+", cells[0]): continue   # "----- TITLES -----" separators
+        vals = (cells[1:] + [""] * len(languages))[:len(languages)]
+        keys[cells[0].upper()] = [v.encode("latin-1").decode(cp, errors="replace")
+                                  for v, cp in zip(vals, codepages)]
+    return {"languages": languages, "keys": keys}
+
+def load_stringtable(path):
+    """Returns the parsed table for path (empty table if the file is missing)."""
+    try:
+        with open(path, "rb") as f: raw = f.read()
+    except OSError:
+        return {"languages": [], "keys": {}}
+    return stringtable_from_bytes(raw)
+
+def stringtable_from_bytes(raw):
+    """Parsed table for stringtable.csv bytes, through the hash-keyed caches."""
+    import hashlib, json, tempfile
+    digest = f"{hashlib.sha1(raw).hexdigest()}-v{STRINGTABLE_CACHE_VERSION}"
+    table = _stringtables.get(digest)
+    if table is not None: return table
+    cache = os.path.join(STRINGTABLE_CACHE_DIR, f"{digest}.json")
+    try:
+        with open(cache, "r", encoding="utf-8") as f: table = json.load(f)
+    except (OSError, ValueError):
+        table = parse_stringtable(raw)
+        os.makedirs(STRINGTABLE_CACHE_DIR, exist_ok=True)
+        # unique temp name: two workers may cache the same table at once
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=STRINGTABLE_CACHE_DIR,
+                                         suffix=".tmp", delete=False) as f:
+            json.dump(table, f, ensure_ascii=False)
+        os.replace(f.name, cache)
+    _stringtables[digest] = table
+    return table
+
+def lookup_string(table, key, lang="English"):
+    """Value of key in lang, falling back to the first (English) column; None if unknown."""
+    vals = table["keys"].get(key.lstrip("@$").upper())
+    if vals is None: return None
+    langs = [l.lower() for l in table["languages"]]
+    i = langs.index(lang.lower()) if lang.lower() in langs else 0
+    return vals[i] or (vals[0] if vals else "") or None
+
+def resolve_string_refs(table, texts, lang="English"):
+    """Resolves every @STR…/$STR… reference in texts; returns {text: resolved or original}."""
+    out = {}
+    for t in texts:
+        if t in out: continue
+        val = lookup_string(table, t, lang) if STRING_REF_RE.fullmatch(t) else None
+        out[t] = val if val is not None else t
+    return out
+
+def briefing_name_from_sqm(raw):
+    """briefingName from mission.sqm bytes without parsing the whole file (None if unset/binarized)."""
+    if raw[:4] == b"\0raP": return None
+    m = BRIEFING_NAME_RE.search(raw.decode("latin-1"))
+    return m.group(1).replace('""', '"') if m else None
+
+def mission_briefing_name(folder):
+    try:
+        with open(os.path.join(folder, "mission.sqm"), "rb") as f: raw = f.read()
+    except OSError:
+        return None
+    return briefing_name_from_sqm(raw)
+
+def pbo_mission_name(pbo_path, lang="English"):
+    """
+    Reads briefingName (resolved through the packed stringtable.csv) straight from a PBO.
+    Raises RuntimeError if mission.sqm is missing, compressed or binarized, or if the
+    stringtable it needs is compressed or truncated.
+    """
+    try:
+        raw = read_pbo_member(pbo_path, "mission.sqm")
+    except (OSError, EOFError) as e:
+        raise RuntimeError(f"unreadable PBO ({e})")
+    if raw is None: raise RuntimeError("no mission.sqm")
+    if raw[:4] == b"\0raP": raise RuntimeError("mission.sqm is binarized")
+    name = briefing_name_from_sqm(raw)
+    if name and STRING_REF_RE.fullmatch(name):
+        try:
+            csv_raw = read_pbo_member(pbo_path, "stringtable.csv")
+        except (OSError, EOFError) as e:
+            raise RuntimeError(f"unreadable stringtable.csv ({e})")
+        if csv_raw is not None:
+            name = resolve_string_refs(stringtable_from_bytes(csv_raw), [name], lang)[name]
+    return name
+
+def list_mission_names(root, lang="English", log=None):
+    """
+    [(folder or .pbo name, human-readable name)] for every extracted mission folder and
+    every .pbo directly under root. PBOs are read in place, not extracted; ones that can't
+    be read (compressed/binarized) are logged and listed under their file name.
+    """
+    items = [(os.path.basename(os.path.normpath(f)), f) for f in find_mission_folders(root)]
+    try:
+        items += [(e.name, e.path) for e in os.scandir(root)
+                  if e.is_file() and e.name.lower().endswith(".pbo")]
+    except OSError:
+        pass
+    names = []
+    for base, path in sorted(items, key=lambda t: t[0].lower()):
+        if os.path.isdir(path):
+            raw = mission_briefing_name(path)
+            if raw and STRING_REF_RE.fullmatch(raw):
+                table = load_stringtable(os.path.join(path, "stringtable.csv"))
+                raw = resolve_string_refs(table, [raw], lang)[raw]
+        else:
+            try:
+                raw = pbo_mission_name(path, lang)
+            except (OSError, EOFError, RuntimeError) as e:
+                if log: log(f"Skipped {base} ({e}) — listed by file name.")
+                raw = None
+        names.append((base, raw or base))
+    return names
+
+def stringtable_report(folder):
+    """
+    Checks a mission's @STR…/$STR… references (and localize "STR…" in scripts)
+    against its stringtable.csv.
+    Returns {'missing': [keys not in the table], 'untranslated': {language: [keys with an empty cell]}}.
+    """
+    table = load_stringtable(os.path.join(folder, "stringtable.csv"))
+    refs = set()
+    for rel in list_mission_files(folder).values():
+        if not rel.lower().endswith((".sqm", ".ext", ".sqs", ".sqf", ".html")): continue
+        with open(os.path.join(folder, rel), "r", encoding="latin-1") as f:
+            text = f.read()
+        refs.update(k.upper() for k in STRING_REF_RE.findall(text))
+        if rel.lower().endswith((".sqs", ".sqf")):
+            refs.update(k.upper() for k in LOCALIZE_RE.findall(text))
+    missing = sorted(k for k in refs if k not in table["keys"])
+    untranslated = {}
+    for i, lang in enumerate(table["languages"]):
+        empty = sorted(k for k, vals in table["keys"].items() if not vals[i])
+        if empty: untranslated[lang] = empty
+    return {"missing": missing, "untranslated": untranslated}
+
 # ============== Wine scanning & linking (in-place) ==============
 def score_candidate(path, target):  # target: "extractpbo" or "derap"
     p = path.replace("\\", "/")
@@ -202,6 +922,7 @@ def score_candidate(path, target):  # target: "extractpbo" or "derap"
     return s
 
 def find_best_tool(prefix, target, log):
+    import glob
     base_dc = os.path.join(prefix, "drive_c")
     log(f"Using Wine prefix: {prefix}")
     globs = [
@@ -415,31 +1136,55 @@ class App(tk.Tk):
         super().__init__()
         self.title("Arma PBO Tools — Install + Extract (cpbo preferred)")
         self.minsize(1080, 780)
-        ensure_dirs()
-        self.default_mpm = pick_default_mpmissions()
+        # Cheap placeholders only; filesystem scans and PATH probes run in
+        # _startup_probe once the window is on screen.
+        self.default_mpm = HOME
+        self.prefix_var = tk.StringVar(value="")
+        self.pbo_var = tk.StringVar(value="")
+        self.out_var = tk.StringVar(value="")
+        self.tabs_built = set()
         self.log_q = queue.Queue()
         self._build_ui()
-        self.after(150, self.refresh_status)
         self.after(50, self._drain_log)
-        self._first_run_notes()
+        self.after_idle(self._startup_probe)
 
     def _build_ui(self):
         root = ttk.Frame(self); root.pack(fill="both", expand=True)
-        for c in range(8): root.columnconfigure(c, weight=1)
-        for r in range(11): root.rowconfigure(r, weight=0)
-        root.rowconfigure(10, weight=1)
+        root.columnconfigure(0, weight=1)
+        root.rowconfigure(1, weight=1)
+
+        # Tab contents are built on first view (see _on_tab_changed); Extract is shown, so built, right away
+        self.nb = ttk.Notebook(root); self.nb.grid(row=0, column=0, sticky="ew", padx=10, pady=8)
+        self.tab_setup = ttk.Frame(self.nb); self.nb.add(self.tab_setup, text="Setup")
+        self.tab_extract = ttk.Frame(self.nb); self.nb.add(self.tab_extract, text="Extract")
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.nb.select(self.tab_extract); self._on_tab_changed()
+
+        # Log
+        logf = ttk.LabelFrame(root, text="Log"); logf.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0,10))
+        logf.rowconfigure(0, weight=1); logf.columnconfigure(0, weight=1)
+        self.log = tk.Text(logf, wrap="word"); self.log.grid(row=0, column=0, sticky="nsew")
+        y = ttk.Scrollbar(logf, orient="vertical", command=self.log.yview); y.grid(row=0, column=1, sticky="ns")
+        self.log.configure(yscrollcommand=y.set)
+
+    def _on_tab_changed(self, _event=None):
+        tab = self.nb.select()
+        if tab in self.tabs_built: return
+        self.tabs_built.add(tab)
+        if tab == str(self.tab_setup): self._build_setup_tab(self.tab_setup)
+        elif tab == str(self.tab_extract): self._build_extract_tab(self.tab_extract)
 
-        env = ttk.LabelFrame(root, text="Setup"); env.grid(row=0, column=0, columnspan=8, sticky="ew", padx=10, pady=8)
+    def _build_setup_tab(self, env):
         for c in range(8): env.columnconfigure(c, weight=1)
 
         # Status
         self.lbl_wine = ttk.Label(env, text="Wine: ?"); self.lbl_wine.grid(row=0, column=0, sticky="w", padx=8)
         self.lbl_cpbo = ttk.Label(env, text="cpbo: ?"); self.lbl_cpbo.grid(row=0, column=1, sticky="w", padx=8)
         self.lbl_unrap= ttk.Label(env, text="unRap: ?"); self.lbl_unrap.grid(row=0, column=2, sticky="w", padx=8)
+        self._start_status_poller()   # only polled once the Setup tab exists
 
         # Prefix controls
         ttk.Label(env, text="Wine prefix:").grid(row=1, column=0, sticky="e", padx=6)
-        self.prefix_var = tk.StringVar(value=get_selected_prefix())
         pref_row = ttk.Frame(env); pref_row.grid(row=1, column=1, columnspan=5, sticky="ew", padx=6)
         pref_row.columnconfigure(0, weight=1)
         ttk.Entry(pref_row, textvariable=self.prefix_var).grid(row=0, column=0, sticky="ew")
@@ -457,23 +1202,24 @@ class App(tk.Tk):
         ttk.Button(env, text="Create/Repair Wrappers", command=self.create_wrappers).grid(row=2, column=6, sticky="e", padx=6, pady=6)
         ttk.Button(env, text="Link ExtractPbo & DeRap", command=self.link_tools).grid(row=2, column=7, sticky="e", padx=6, pady=6)
 
+    def _build_extract_tab(self, root):
+        for c in range(8): root.columnconfigure(c, weight=1)
+
         # Paths
-        ttk.Label(root, text="PBO file:").grid(row=2, column=0, sticky="w", padx=10)
-        self.pbo_var = tk.StringVar(value=self.default_mpm)  # start at MPMissions
-        pbo_row = ttk.Frame(root); pbo_row.grid(row=2, column=1, columnspan=7, sticky="ew", padx=10)
+        ttk.Label(root, text="PBO file:").grid(row=0, column=0, sticky="w", padx=10, pady=(8,0))
+        pbo_row = ttk.Frame(root); pbo_row.grid(row=0, column=1, columnspan=7, sticky="ew", padx=10, pady=(8,0))
         pbo_row.columnconfigure(0, weight=1)
         ttk.Entry(pbo_row, textvariable=self.pbo_var).grid(row=0, column=0, sticky="ew")
         ttk.Button(pbo_row, text="Browse…", command=self.pick_pbo).grid(row=0, column=1, padx=6)
 
-        ttk.Label(root, text="Output / Mission folder:").grid(row=3, column=0, sticky="w", padx=10)
-        self.out_var = tk.StringVar(value=self.default_mpm)
-        out_row = ttk.Frame(root); out_row.grid(row=3, column=1, columnspan=7, sticky="ew", padx=10)
+        ttk.Label(root, text="Output / Mission folder:").grid(row=1, column=0, sticky="w", padx=10)
+        out_row = ttk.Frame(root); out_row.grid(row=1, column=1, columnspan=7, sticky="ew", padx=10)
         out_row.columnconfigure(0, weight=1)
         ttk.Entry(out_row, textvariable=self.out_var).grid(row=0, column=0, sticky="ew")
         ttk.Button(out_row, text="Choose…", command=self.pick_out).grid(row=0, column=1, padx=6)
 
         # Actions
-        btns = ttk.LabelFrame(root, text="Actions"); btns.grid(row=4, column=0, columnspan=8, sticky="ew", padx=10, pady=8)
+        btns = ttk.LabelFrame(root, text="Actions"); btns.grid(row=2, column=0, columnspan=8, sticky="ew", padx=10, pady=8)
         for c in range(8): btns.columnconfigure(c, weight=1)
         self.progress = ttk.Progressbar(btns, mode="determinate")
         self.progress.grid(row=0, column=7, sticky="ew", padx=6, pady=6)
@@ -486,15 +1232,11 @@ class App(tk.Tk):
         ttk.Button(btns, text="Fallback: Extract UNCOMPRESSED", command=self.do_extract_fallback).grid(row=0, column=4, sticky="ew", padx=6, pady=6)
         ttk.Button(btns, text="Copy Log", command=self.copy_log).grid(row=0, column=5, sticky="ew", padx=6, pady=6)
         ttk.Button(btns, text="Save Log…", command=self.save_log).grid(row=0, column=6, sticky="ew", padx=6, pady=6)
-
-        # Log
-        logf = ttk.LabelFrame(root, text="Log"); logf.grid(row=10, column=0, columnspan=8, sticky="nsew", padx=10, pady=(0,10))
-        logf.rowconfigure(0, weight=1); logf.columnconfigure(0, weight=1)
-        self.log = tk.Text(logf, wrap="word"); self.log.grid(row=0, column=0, sticky="nsew")
-        y = ttk.Scrollbar(logf, orient="vertical", command=self.log.yview); y.grid(row=0, column=1, sticky="ns")
-        self.log.configure(yscrollcommand=y.set)
-        self._log(f"Default MPMissions: {self.default_mpm}")
-        self._log(f"Current Wine prefix: {get_selected_prefix()}")
+        ttk.Button(btns, text="Analyze mission assets", command=self.do_analyze_assets).grid(row=1, column=0, sticky="ew", padx=6, pady=6)
+        ttk.Button(btns, text="Pack slim .pbo (used files only)", command=self.do_pack_slim).grid(row=1, column=1, sticky="ew", padx=6, pady=6)
+        ttk.Button(btns, text="Mission library stats", command=self.do_library_stats).grid(row=1, column=2, sticky="ew", padx=6, pady=6)
+        ttk.Button(btns, text="List mission names", command=self.do_list_names).grid(row=1, column=3, sticky="ew", padx=6, pady=6)
+        ttk.Button(btns, text="Check stringtable", command=self.do_check_stringtable).grid(row=1, column=4, sticky="ew", padx=6, pady=6)
 
     # ------------- helpers & status -------------
     def _log(self, msg): self.log.insert("end", msg + "\n"); self.log.see("end")
@@ -505,8 +1247,27 @@ class App(tk.Tk):
         except queue.Empty: pass
         finally: self.after(50, self._drain_log)
 
-    def _first_run_notes(self):
-        if not path_contains_local_bin():
+    def _startup_probe(self):
+        """Runs the slow start-up checks off the UI thread, then fills in the results."""
+        def run():
+            ensure_dirs()
+            found = {
+                "mpm": pick_default_mpmissions(),
+                "prefix": get_selected_prefix(),
+                "path_ok": path_contains_local_bin(),
+            }
+            self.after(0, lambda: self._apply_startup(found))
+        threading.Thread(target=run, daemon=True).start()
+
+    def _apply_startup(self, found):
+        self.default_mpm = found["mpm"]
+        # Don't clobber anything the user typed while the probe was running
+        if not self.prefix_var.get(): self.prefix_var.set(found["prefix"])
+        if not self.pbo_var.get(): self.pbo_var.set(self.default_mpm)  # start at MPMissions
+        if not self.out_var.get(): self.out_var.set(self.default_mpm)
+        self._log(f"Default MPMissions: {self.default_mpm}")
+        self._log(f"Current Wine prefix: {found['prefix']}")
+        if not found["path_ok"]:
             self._log("PATH note: ~/.local/bin is NOT in PATH. Add it for new shells:\n  echo 'export PATH=\"$HOME/.local/bin:$PATH\"' >> ~/.bashrc && source ~/.bashrc")
 
     def copy_log(self):
@@ -521,14 +1282,23 @@ class App(tk.Tk):
             f.write(self.log.get("1.0", "end-1c"))
         messagebox.showinfo("Saved", f"Log saved to:\n{path}")
 
-    def refresh_status(self):
+    def _start_status_poller(self):
+        """One worker thread that re-probes wine/cpbo/unrap every 2 s until the window closes."""
+        def run():
+            while True:
+                found = {"wine": have_cmd("wine"), "cpbo": have_cmd("cpbo"), "unrap": have_cmd("unrap")}
+                try: self.after(0, lambda: self._apply_status(found))
+                except (RuntimeError, tk.TclError): return   # window closed
+                time.sleep(2.0)
+        threading.Thread(target=run, daemon=True).start()
+
+    def _apply_status(self, found):
         def mark(lbl, ok):
             base = lbl.cget("text").split(":")[0]
             lbl.config(text=f"{base}: {'✓' if ok else '✗'}", foreground=("#0a0" if ok else "#a00"))
-        mark(self.lbl_wine, have_cmd("wine"))
-        mark(self.lbl_cpbo, have_cmd("cpbo"))
-        mark(self.lbl_unrap, have_cmd("unrap"))
-        self.after(2000, self.refresh_status)
+        mark(self.lbl_wine, found["wine"])
+        mark(self.lbl_cpbo, found["cpbo"])
+        mark(self.lbl_unrap, found["unrap"])
 
     # ------------- prefix controls -------------
     def pick_prefix(self):
@@ -656,7 +1426,9 @@ class App(tk.Tk):
         self._log(f"cpbo -e {pbo} {outdir}")
         def run():
             try:
-                cpbo_extract(pbo, outdir, self._enqueue)
+                def prog_fn(frac): self.after(0, lambda: self.progress.config(value=max(0.0, min(1.0, frac))))
+                cpbo_extract(pbo, outdir, self._enqueue, prog_fn)
+                prog_fn(1.0)
                 self._enqueue("cpbo extraction complete.")
                 self.after(0, lambda: messagebox.showinfo("Done", "cpbo extraction complete."))
             except Exception as e:
@@ -693,6 +1465,120 @@ class App(tk.Tk):
                 self.after(0, lambda: messagebox.showerror("Error", str(e)))
         threading.Thread(target=run, daemon=True).start()
 
+    def do_analyze_assets(self):
+        folder = self.out_var.get().strip()
+        if not folder or not os.path.isdir(folder):
+            return messagebox.showwarning("Pick folder", "Choose an extracted mission folder first.")
+        self._log(f"Analyzing assets in {folder}")
+        def run():
+            try:
+                report = analyze_mission_assets(folder)
+                log_asset_report(report, self._enqueue)
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+        threading.Thread(target=run, daemon=True).start()
+
+    def do_pack_slim(self):
+        folder = self.out_var.get().strip()
+        if not folder or not os.path.isdir(folder):
+            return messagebox.showwarning("Pick folder", "Choose a mission folder to pack.")
+        if not have_cmd("cpbo"):
+            return messagebox.showwarning("cpbo missing", "Install ExtractPbo, Link tools, then try again.")
+        out_pbo = filedialog.asksaveasfilename(
+            title="Save slim .pbo as",
+            initialdir=self.default_mpm,
+            defaultextension=".pbo",
+            filetypes=[("PBO files","*.pbo")]
+        )
+        if not out_pbo: return
+        self.progress['value'] = 0.0
+        self._log(f"Slim pack {folder} → {out_pbo}")
+        def pack(report):
+            try:
+                build_slim_pbo(folder, out_pbo, self._enqueue, allow_unresolved=True, report=report)
+                self._enqueue(f"Packed {len(report['used'])} file(s) → {out_pbo}")
+                self.after(0, lambda: messagebox.showinfo("Done", f"Packed (slim):\n{out_pbo}"))
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+        def confirm(report):
+            # Tk thread: ask, then hand the same report back to a worker
+            missing = list(report["missing"])
+            names = "\n".join(f"  {ref}" for ref in missing[:15])
+            more = f"\n  … and {len(missing) - 15} more" if len(missing) > 15 else ""
+            if not messagebox.askyesno(
+                    "Unresolved references",
+                    f"These names could not be matched to files in the mission:\n{names}{more}\n\n"
+                    "If any of them is a mission file, pruning will drop it. Pack anyway?"):
+                self._log("Slim pack cancelled.")
+                return
+            threading.Thread(target=pack, args=(report,), daemon=True).start()
+        def run():
+            try:
+                report = analyze_mission_assets(folder)
+                log_asset_report(report, self._enqueue)
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+                return
+            if report["missing"]: self.after(0, lambda: confirm(report))
+            else: pack(report)
+        threading.Thread(target=run, daemon=True).start()
+
+    def do_library_stats(self):
+        initdir = self.default_mpm if os.path.isdir(self.default_mpm) else HOME
+        root = filedialog.askdirectory(title="Select folder of extracted missions", initialdir=initdir)
+        if not root: return
+        self._log(f"Mission stats for {root}")
+        def run():
+            try:
+                lib = load_mission_library(root, self._enqueue)
+                for mission in sorted(set(lib["mission"].tolist())):
+                    units = select_rows(lib, mission=mission, kind="unit")
+                    counts = ", ".join(f"{k} {v}" for k, v in side_counts(units).items())
+                    spread = ", ".join(f"{k} ±{r:.0f}m" for k, (_x, _y, r) in side_spread(units).items())
+                    self._enqueue(f"  {mission}: units {counts or '-'}; spread {spread or '-'}")
+                self._enqueue(f"{len(lib['kind'])} rows from {len(set(lib['mission'].tolist()))} mission(s).")
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+        threading.Thread(target=run, daemon=True).start()
+
+    def do_list_names(self):
+        initdir = self.default_mpm if os.path.isdir(self.default_mpm) else HOME
+        root = filedialog.askdirectory(title="Select MPMissions or a folder of extracted missions", initialdir=initdir)
+        if not root: return
+        def run():
+            try:
+                names = list_mission_names(root, log=self._enqueue)
+                for folder, name in names:
+                    self._enqueue(f"  {folder}: {name}")
+                self._enqueue(f"{len(names)} mission(s) in {root}")
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+        threading.Thread(target=run, daemon=True).start()
+
+    def do_check_stringtable(self):
+        folder = self.out_var.get().strip()
+        if not folder or not os.path.isdir(folder):
+            return messagebox.showwarning("Pick folder", "Choose an extracted mission folder first.")
+        self._log(f"Checking stringtable references in {folder}")
+        def run():
+            try:
+                report = stringtable_report(folder)
+                for key in report["missing"]:
+                    self._enqueue(f"  missing key (or game string): {key}")
+                for lang, keys in report["untranslated"].items():
+                    self._enqueue(f"  {lang}: {len(keys)} untranslated — {', '.join(keys)}")
+                if not report["missing"] and not report["untranslated"]:
+                    self._enqueue("  All referenced keys present and translated.")
+            except Exception as e:
+                self._enqueue(f"ERROR: {e}")
+                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+        threading.Thread(target=run, daemon=True).start()
+
     def do_unrap(self):
         if not have_cmd("unrap"):
             return messagebox.showwarning("unRap missing", "Install DeRap, Link tools, then try again.")
@@ -701,18 +1587,19 @@ class App(tk.Tk):
             self._log("Aborting unrap due to missing runtime.")
             return
         initdir = self.default_mpm if os.path.isdir(self.default_mpm) else HOME
-        target = filedialog.askopenfilename(
-            title="Select .bin/.rap/.cfg",
+        targets = filedialog.askopenfilenames(
+            title="Select .bin/.rap/.cfg (one or more)",
             initialdir=initdir,
             filetypes=[("Binary configs", ("*.bin","*.rap","*.cfg")), ("All files","*.*")]
         )
-        if not target: return
+        if not targets: return
+        targets = list(targets)
         self.progress['value'] = 0.0
-        self._log(f"unrap {target}")
+        for t in targets: self._log(f"unrap {t}")
         def run():
             try:
-                unrap_file(target, self._enqueue)
-                self._enqueue("unRap completed.")
+                unrap_files(targets, self._enqueue)
+                self._enqueue(f"unRap completed ({len(targets)} file(s)).")
                 self.after(0, lambda: messagebox.showinfo("Done", "DeRap completed."))
             except Exception as e:
                 self._enqueue(f"ERROR: {e}")